@@ -9,7 +9,7 @@ from functools import cached_property
 from typing import NamedTuple
 
 import numpy as np
-from numpy import float64
+from numpy import float32
 from numpy.typing import NDArray
 
 
@@ -27,9 +27,9 @@ class CartesianField(NamedTuple):
         Field magnitude at each point.
     """
 
-    points: NDArray[float64]
-    vectors_unit: NDArray[float64]
-    magnitude: NDArray[float64]
+    points: NDArray[float32]
+    vectors_unit: NDArray[float32]
+    magnitude: NDArray[float32]
 
 
 @dataclass(frozen=True)
@@ -62,14 +62,34 @@ class CoaxialCylinder:
 
     EPS = 1e-15
 
+    def _uniform_samples(self, start: float, stop: float, n_min: int):
+        """
+        Sample the interval [start, stop] with a stride of exactly Δ.
+
+        The samples start at ``start`` and reach ``stop`` whenever the span
+        is a multiple of Δ. If fewer than ``n_min`` samples fit, ``n_min``
+        evenly spaced samples are used instead.
+        """
+
+        # Whole steps of Δ within the span (tolerant to round-off)
+        n_steps = int((stop - start) / self.Δ + 1e-6)
+
+        if n_steps + 1 >= n_min:
+            # Stepped in float64 so round-off does not accumulate along the axis
+            end = start + (n_steps + 0.5) * self.Δ
+            return np.arange(start, end, self.Δ).astype(float32)
+
+        return np.linspace(start, stop, n_min, dtype=float32)
+
     @cached_property
     def spaced_coordinates(self):
         """
         Generate uniformly spaced cylindrical coordinates.
 
-        The number of points in each direction is estimated from the
-        geometry and spacing, with minimum thresholds to ensure
-        numerical stability.
+        Radial and axial samples use a stride of exactly Δ, with minimum
+        thresholds to ensure numerical stability. The number of angular
+        samples is estimated from the arc length at the mean radius and
+        spread evenly over the full turn.
 
         Returns
         -------
@@ -81,24 +101,37 @@ class CoaxialCylinder:
             Axial coordinates centered at z = 0.
         """
 
-        # Estimated number of samples
-        N_r = int((self.r_o - self.r_i) / self.Δ)
-        N_theta = int(np.pi * (self.r_i + self.r_o) / self.Δ)
-        N_z = int(self.L / self.Δ)
+        r = self._uniform_samples(self.r_i, self.r_o, 10)
 
-        # Enforce minimum resolution
-        N_r_min = max(N_r, 10)
+        # Evenly spread so the grid closes on itself at θ = 2π
+        N_theta = int(np.pi * (self.r_i + self.r_o) / self.Δ)
         N_theta_min = max(N_theta, 20)
-        N_z_min = max(N_z, 5)
 
-        r = np.linspace(self.r_i, self.r_o, N_r_min)
-        theta = np.linspace(0, 2 * np.pi, N_theta_min, endpoint=False)
+        theta = np.linspace(0, 2 * np.pi, N_theta_min, endpoint=False, dtype=float32)
 
         half_L = self.L / 2
-        z = np.linspace(-half_L, half_L, N_z_min)
+        z = self._uniform_samples(-half_L, half_L, 5)
 
         return r, theta, z
 
+    @cached_property
+    def angular_basis(self):
+        """
+        Cosine and sine of the angular samples.
+
+        Evaluated once per θ sample and broadcast over the (r, z) axes
+        wherever the angular dependence is needed.
+
+        Returns
+        -------
+        cos_t, sin_t : ndarray of shape (N_theta,)
+            Cosine and sine of each angular coordinate.
+        """
+
+        _, theta, _ = self.spaced_coordinates
+
+        return np.cos(theta), np.sin(theta)
+
     @cached_property
     def points(self):
         """
@@ -115,18 +148,42 @@ class CoaxialCylinder:
         """
 
         r, theta, z = self.spaced_coordinates
-        rr, tt, zz = np.meshgrid(r, theta, z, indexing="ij")
+        cos_t, sin_t = self.angular_basis
+
+        shape = (r.size, theta.size, z.size)
+
+        x = np.empty(shape, dtype=float32)
+        y = np.empty(shape, dtype=float32)
+        zz = np.empty(shape, dtype=float32)
 
-        x = rr * np.cos(tt)
-        y = rr * np.sin(tt)
+        # (N_r, N_theta) outer products, broadcast along z
+        x[...] = np.multiply.outer(r, cos_t)[..., None]
+        y[...] = np.multiply.outer(r, sin_t)[..., None]
+        zz[...] = z
 
-        # Flatten arrays
+        # Flatten arrays (views, since the grids above are C-contiguous)
         x_f = x.ravel()
         y_f = y.ravel()
         z_f = zz.ravel()
 
         return x_f, y_f, z_f
 
+    @cached_property
+    def _r(self):
+        """
+        Regularized radial coordinate of every grid point.
+
+        Taken directly from the radial samples rather than recovered from
+        (x, y), so no square root is evaluated over the grid.
+        """
+
+        r, _, _ = self.spaced_coordinates
+
+        # Prevent singularities at r = 0
+        r_safe: NDArray[float32] = np.maximum(r, self.EPS)
+
+        return self.expand_radial(r_safe)
+
     @cached_property
     def rz_coordinates(self):
         """
@@ -144,16 +201,37 @@ class CoaxialCylinder:
             Axial coordinates.
         """
 
-        x, y, z = self.points
+        _, _, z = self.points
 
-        r = np.hypot(x, y)
+        return self._r, z
 
-        # Prevent singularities at r = 0
-        r_safe: NDArray[float64] = np.maximum(r, self.EPS)
+    def expand_radial(self, values: NDArray):
+        """
+        Expand per-radius values to all grid points.
 
-        return r_safe, z
+        Grid points are ordered with r as the slowest-varying index, so a
+        value defined per radial sample is repeated over every (θ, z) pair
+        sharing that radius.
+
+        Parameters
+        ----------
+        values : ndarray of shape (N_r,)
+            Values defined at each radial sample.
 
-    def to_cartesian(self, Er: NDArray[float64], Ez: NDArray[float64]):
+        Returns
+        -------
+        ndarray of shape (N,)
+            Values at each grid point, in the same order as ``points``.
+        """
+
+        r, theta, z = self.spaced_coordinates
+
+        if values.shape != r.shape:
+            raise ValueError("values must match the number of radial samples.")
+
+        return np.repeat(values, theta.size * z.size)
+
+    def to_cartesian(self, Er: NDArray[float32], Ez: NDArray[float32]):
         """
         Convert cylindrical field components to Cartesian vectors.
 
@@ -176,24 +254,36 @@ class CoaxialCylinder:
 
         x, y, z = self.points
 
-        r = np.hypot(x, y)
-
-        if Er.shape != Ez.shape or Er.shape != r.shape:
+        if Er.shape != Ez.shape or Er.shape != x.shape:
             raise ValueError("Er and Ez must match the number of grid points.")
 
-        # Avoid division by zero at the axis
-        r_safe = np.maximum(r, self.EPS)
+        r, theta, z_s = self.spaced_coordinates
+        cos_t, sin_t = self.angular_basis
+
+        shape = (r.size, theta.size, z_s.size)
+
+        # Fill the (N, 3) arrays column by column to get C-contiguous output
+        vectors = np.empty((x.size, 3), dtype=float32)
 
-        Ex = Er * (x / r_safe)
-        Ey = Er * (y / r_safe)
+        # x / r and y / r are cos θ and sin θ: project Er on the grid view
+        # using the angular basis instead of dividing by r at every point
+        Er_grid = Er.reshape(shape)
+        vectors_grid = vectors.reshape(*shape, 3)
+        np.multiply(Er_grid, cos_t[:, None], out=vectors_grid[..., 0])
+        np.multiply(Er_grid, sin_t[:, None], out=vectors_grid[..., 1])
+        vectors[:, 2] = Ez
 
-        vectors = np.vstack((Ex, Ey, Ez)).T
-        points = np.vstack((x, y, z)).T
+        points = np.empty((x.size, 3), dtype=float32)
+        points[:, 0] = x
+        points[:, 1] = y
+        points[:, 2] = z
 
-        mag: NDArray[float64] = np.linalg.norm(vectors, axis=1)
+        mag: NDArray[float32] = np.sqrt(np.einsum("ij,ij->i", vectors, vectors))
 
-        mag_safe: NDArray[float64] = np.maximum(mag, 1e-15)
+        # Normalize in place by the inverse magnitude; null vectors stay null
+        inv_mag = np.zeros_like(mag)
+        np.divide(1, mag, out=inv_mag, where=mag > 0)
 
-        vectors_unit = vectors / mag_safe[:, None]
+        vectors *= inv_mag[:, None]
 
-        return CartesianField(points, vectors_unit, mag)
+        return CartesianField(points, vectors, mag)
@@ -11,6 +11,7 @@ from enum import IntEnum, auto
 
 import cylinder
 import numpy as np
+from numba import njit, prange
 
 
 class Region(IntEnum):
@@ -27,6 +28,67 @@ class Region(IntEnum):
     DIELECTRIC = auto()
 
 
+@njit(parallel=True, fastmath=True, cache=True)
+def _field_kernel(r, z, half_L, amplitude, r_d, scale_eps):
+    """
+    Evaluate the cylindrical field components in a single fused pass.
+
+    Each grid point is visited once: the inverse distances to both cylinder
+    ends are computed, shared between Er and Ez, and the permittivity-jump
+    correction is applied as a scalar branch.
+
+    Parameters
+    ----------
+    r, z : ndarray of shape (N,)
+        Cylindrical coordinates of the grid points.
+    half_L : float
+        Half of the cylinder length.
+    amplitude : float
+        Product of the applied voltage and the geometric factor.
+    r_d : float
+        Inner radius of the corrected (gas) region.
+    scale_eps : float
+        Permittivity ratio applied inside the corrected region.
+
+    Returns
+    -------
+    Er, Ez : ndarray of shape (N,)
+        Radial and axial field components.
+    """
+
+    Er = np.empty_like(r)
+    Ez = np.empty_like(r)
+
+    for i in prange(r.size):
+        r_i = r[i]
+
+        zp = z[i] + half_L
+        zm = z[i] - half_L
+
+        r2 = r_i * r_i
+
+        # Inverse distances to both ends, shared by Er and Ez
+        inv_rp = 1 / np.sqrt(r2 + zp * zp)
+        inv_rm = 1 / np.sqrt(r2 + zm * zm)
+
+        axial_factor = (zp * inv_rp - zm * inv_rm) / 2
+
+        Er_i = amplitude * axial_factor / r_i
+        Ez_i = amplitude * (inv_rm - inv_rp)
+
+        # Permittivity-jump correction derived from boundary conditions.
+        # NOTE: This applies in the gas region due to ε-discontinuity at r = r_d.
+        # The grid never exceeds r_b, so only the lower bound is tested.
+        if r_i >= r_d:
+            Er_i *= scale_eps
+            Ez_i *= scale_eps
+
+        Er[i] = Er_i
+        Ez[i] = Ez_i
+
+    return Er, Ez
+
+
 @dataclass(frozen=True)
 class DielectricField:
     """
@@ -70,7 +132,8 @@ class DielectricField:
 
         The field is first calculated in cylindrical coordinates (Er, Ez),
         corrected inside the gas region, and then converted to Cartesian
-        coordinates.
+        coordinates. The cylindrical components are evaluated by a compiled
+        kernel in a single pass over the grid.
 
         Returns
         -------
@@ -81,31 +144,16 @@ class DielectricField:
 
         r, z = self.coords.rz_coordinates
 
-        half_L = self.L / 2
-
-        zp = z + half_L
-        zm = z - half_L
-
-        rp = np.hypot(r, zp)
-        rm = np.hypot(r, zm)
-
-        term1 = zp / rp
-        term2 = zm / rm
-
-        axial_factor = (term1 - term2) / 2
-
-        Er = self.V_0 * self.geometric_factor * axial_factor / r
-        Ez = self.V_0 * self.geometric_factor * (1 / rm - 1 / rp)
-
-        # Permittivity-jump correction derived from boundary conditions.
-        # NOTE: This applies in the gas region due to ε-discontinuity at r = r_d.
-        mask_eps_jump = (r >= self.r_d) & (r <= self.r_b)
-        scale_eps = self.eps_d / self.eps_g
-
-        Er_corr = np.where(mask_eps_jump, Er * scale_eps, Er)
-        Ez_corr = np.where(mask_eps_jump, Ez * scale_eps, Ez)
+        Er, Ez = _field_kernel(
+            r,
+            z,
+            self.L / 2,
+            self.V_0 * self.geometric_factor,
+            self.r_d,
+            self.eps_d / self.eps_g,
+        )
 
-        return self.coords.to_cartesian(Er_corr, Ez_corr)
+        return self.coords.to_cartesian(Er, Ez)
 
     def mean_radial_error(self):
         """
@@ -148,9 +196,13 @@ class DielectricField:
             Integer region labels (Region.GAS or Region.DIELECTRIC).
         """
 
-        r, _ = self.coords.rz_coordinates
+        r, _, _ = self.coords.spaced_coordinates
+
+        # Regions depend on r only: classify the radial samples, then expand.
+        # The grid starts at r_a, so r_d is the only boundary: index 0 up to
+        # and including r_d, 1 beyond it.
+        index = np.searchsorted([self.r_d], r, side="left")
 
-        regions = np.full(r.shape, Region.GAS, dtype=np.int8)
-        regions[(r >= self.r_a) & (r <= self.r_d)] = Region.DIELECTRIC
+        labels = np.array([Region.DIELECTRIC, Region.GAS], dtype=np.int8)
 
-        return regions
+        return self.coords.expand_radial(labels[index])
@@ -7,7 +7,6 @@ Description:
 
 from functools import cached_property
 
-import numpy as np
 import pyvista as pv
 from field import DielectricField, Region
 
@@ -51,13 +50,14 @@ class PlotBuilder:
         - Unit electric field vectors
         - Field magnitude
         - Region classification labels
-        - Region-specific masked magnitudes
         """
 
         points, vectors_unit, mag = self.field.calculate_field()
-        regions = self.field.regions().astype(np.int8)
+        regions = self.field.regions()
 
-        cloud = pv.PolyData(points)
+        # All arrays are C-contiguous float32 (int8 for labels), so PyVista
+        # wraps them as VTK arrays without copying and keeps them alive
+        cloud = pv.PolyData(points, deep=False)
 
         # Vector data
         cloud["vectors"] = vectors_unit
@@ -68,40 +68,45 @@ class PlotBuilder:
         # Region labels
         cloud["region"] = regions
 
-        # Region-specific magnitudes (NaN-masked)
-        cloud["mag_gas"] = np.where(regions == Region.GAS, mag, np.nan)
-        cloud["mag_diel"] = np.where(regions == Region.DIELECTRIC, mag, np.nan)
-
         return cloud
 
-    def add_glyphs(self):
+    @cached_property
+    def glyphs(self):
         """
-        Add electric field glyphs to the plot using the cached cloud.
+        Cached glyph mesh built from the cloud.
 
-        This method renders oriented glyphs at the cloud points using the
-        unit electric field vectors. Glyph size is fixed and independent
-        of field magnitude.
+        Oriented glyphs are placed at the cloud points using the unit
+        electric field vectors. Glyph size is fixed and independent of
+        field magnitude.
+        """
 
-        Field magnitude is encoded by color, with separate colormaps
-        applied to each physical region (gas and dielectric) based on
-        region-specific scalar fields stored in the cloud.
+        return self.cloud.glyph(orient="vectors", scale=False, factor=self.glyph_size)
+
+    def add_glyphs(self):
         """
+        Add electric field glyphs to the plot using the cached glyph mesh.
 
-        glyphs = self.cloud.glyph(orient="vectors", scale=False, factor=self.glyph_size)
+        Field magnitude is encoded by color, with separate colormaps
+        applied to each physical region (gas and dielectric). Each region
+        is extracted by thresholding the region labels, so the global
+        magnitude already covers only that region's glyphs.
+        """
 
-        glyphs_gas = glyphs.threshold(Region.GAS, scalars="region")
-        glyphs_diel = glyphs.threshold(Region.DIELECTRIC, scalars="region")
+        glyphs_gas = self.glyphs.threshold((Region.GAS, Region.GAS), scalars="region")
+        glyphs_diel = self.glyphs.threshold(
+            (Region.DIELECTRIC, Region.DIELECTRIC), scalars="region"
+        )
 
         self.plotter.add_mesh(
             glyphs_gas,
-            scalars="mag_gas",
+            scalars="magnitude",
             cmap="viridis",
             scalar_bar_args={"title": "|E| GAS [V/m]"},
         )
 
         self.plotter.add_mesh(
             glyphs_diel,
-            scalars="mag_diel",
+            scalars="magnitude",
             cmap="plasma",
             scalar_bar_args={"title": "|E| DIELECTRIC [V/m]"},
         )
@@ -110,16 +115,17 @@ class PlotBuilder:
         """
         Add Cartesian reference axes to the plot.
 
-        The axis extents are determined from the spatial extent of the
-        cached cloud, ensuring that the axes are well-scaled and independent
-        of the order in which plot elements are added.
+        The axis extents are determined from the geometry bounds
+        (outer radius and half length), ensuring that the axes are
+        well-scaled and independent of the order in which plot elements
+        are added.
 
         Axes are centered at the origin and colored according to the
         standard convention:
         x-axis (red), y-axis (green), z-axis (blue).
         """
 
-        axis_length = np.max(np.abs(self.cloud.points))
+        axis_length = max(self.field.r_b, self.field.L / 2)
 
         x_axis = pv.Line((-axis_length, 0, 0), (axis_length, 0, 0))
         y_axis = pv.Line((0, -axis_length, 0), (0, axis_length, 0))